@@ -1,3 +1,4 @@
+import logging
 import os
 from dotenv import load_dotenv, find_dotenv
 import yaml
@@ -9,6 +10,7 @@ from py_scripts.client import DWHClient, BankDBClient
 if __name__ == "__main__":
     # Загружаем переменные окружения из файла .env
     load_dotenv(find_dotenv())
+    logging.basicConfig(level=logging.INFO)
 
     # Загружаем конфигурацию из объединенного файла conf.yaml
     with open("conf.yaml", "r") as conf_file:
@@ -46,7 +48,8 @@ if __name__ == "__main__":
         dwh_client.create_schema("main.ddl")
 
         # Вставляем данные из банковской базы в таблицы DWH
-        dwh_client.insert_bank_tables(bank_client)
+        # (извлечение и загрузка идут конвейером, SCD2 по таблицам - параллельно)
+        dwh_client.insert_bank_tables(bank_client, **config.get("bank_load", {}))
 
         # Получаем данные для загрузки
         incoming_data = load_data_from_files(config["data_dir"], config["patterns"])
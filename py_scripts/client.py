@@ -1,4 +1,10 @@
+import copy
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 import psycopg2
@@ -11,21 +17,27 @@ class Client:
         self.logger = logging.getLogger(__name__)
         self.connection: Connection = None
         self.schema = schema
+        self.connection_params = dict(database=database, host=host, user=user, password=password, port=port)
 
         try:
             # Подключение к базе данных
-            self.connection = psycopg2.connect(
-                database=database,
-                host=host,
-                user=user,
-                password=password,
-                port=port,
-            )
-            self.connection.autocommit = False
+            self.connection = self._connect()
         except Exception as e:
             print(e)
             raise
 
+    def _connect(self):
+        """Открывает новое соединение с базой данных по сохраненным параметрам."""
+        connection = psycopg2.connect(**self.connection_params)
+        connection.autocommit = False
+        return connection
+
+    def clone(self):
+        """Создает копию клиента с отдельным соединением (для работы в другом потоке)."""
+        client = copy.copy(self)
+        client.connection = self._connect()
+        return client
+
     def is_table_empty(self, table_name):
         """Проверяет, пустая ли таблица."""
         query = f"SELECT NOT EXISTS (SELECT 1 FROM {table_name} LIMIT 1);"
@@ -176,20 +188,91 @@ class DWHClient(Client):
             cursor.execute(insert_query)
             self.connection.commit()
 
-    def insert_bank_tables(self, bank_client):
-        """Вставка данных в банковские таблицы, такие как accounts, clients, cards."""
-        for dim_field_name, _ in self.schema.DIM:
-
-            if hasattr(bank_client.schema, dim_field_name):
-
-                bank_table_name = bank_client.schema.__getattribute__(dim_field_name)
-                data = bank_client.fetch_data_to_df(bank_table_name)
+    def insert_bank_tables(self, bank_client, workers = 3, queue_size = 2):
+        """Вставка данных в банковские таблицы, такие как accounts, clients, cards.
 
-                self.insert_to_stg_table(dim_field_name, data)
-
-                scd2_config = self.scd2_config.get(dim_field_name)
-                if scd2_config is not None:
-                    self.insert_from_stg_table_to_dim_table(dim_field_name, **scd2_config)
+        Извлечение из банковской БД (производитель) идет параллельно с загрузкой в DWH (потребители):
+        каждый потребитель работает на своем соединении и выполняет загрузку в staging и SCD2
+        независимо от остальных. Ограниченная очередь не дает производителю уйти далеко вперед.
+        Возвращает отчет с временем этапов по каждой таблице.
+        """
+        field_names = [name for name, _ in self.schema.DIM if hasattr(bank_client.schema, name)]
+        if not field_names:
+            return {}
+
+        workers = max(1, min(workers, len(field_names)))
+        tasks = queue.Queue(maxsize=max(1, queue_size))
+        stop_event = threading.Event()
+        report = {name: {} for name in field_names}
+
+        def put(item):
+            # Ждем места в очереди, пока конвейер не остановлен из-за ошибки
+            while not stop_event.is_set():
+                try:
+                    tasks.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce():
+            try:
+                for field_name in field_names:
+                    if stop_event.is_set():
+                        return
+                    start = time.perf_counter()
+                    data = bank_client.fetch_data_to_df(getattr(bank_client.schema, field_name))
+                    report[field_name]["rows"] = len(data)
+                    report[field_name]["fetch"] = time.perf_counter() - start
+                    put((field_name, data, time.perf_counter()))
+                for _ in range(workers):
+                    put(None)
+            except Exception:
+                stop_event.set()
+                raise
+
+        def consume():
+            worker = None
+            try:
+                worker = self.clone()
+                while not stop_event.is_set():
+                    try:
+                        item = tasks.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    if item is None:
+                        return
+                    field_name, data, enqueued = item
+                    table_report = report[field_name]
+                    table_report["queue_wait"] = time.perf_counter() - enqueued
+
+                    start = time.perf_counter()
+                    worker.insert_to_stg_table(field_name, data)
+                    table_report["stg"] = time.perf_counter() - start
+
+                    scd2_config = self.scd2_config.get(field_name)
+                    if scd2_config is not None:
+                        start = time.perf_counter()
+                        worker.insert_from_stg_table_to_dim_table(field_name, **scd2_config)
+                        table_report["scd2"] = time.perf_counter() - start
+            except Exception:
+                stop_event.set()
+                raise
+            finally:
+                if worker:
+                    worker.close_connection()
+
+        with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+            futures = [executor.submit(produce)] + [executor.submit(consume) for _ in range(workers)]
+            for future in futures:
+                future.result()
+
+        for field_name, table_report in report.items():
+            self.logger.info(
+                "%s: %s", field_name,
+                ", ".join(f"{key}={value:.3f}s" if isinstance(value, float) else f"{key}={value}"
+                          for key, value in table_report.items())
+            )
+        return report
 
     def insert_incoming_tables(self, incoming_data, date):
         """Вставка входящих данных в соответствующие таблицы."""